@@ -3,7 +3,40 @@ import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
 
-from financial_logic import calculate_future_value, calculate_loan_emi
+from financial_logic import calculate_future_value, calculate_loan_emi, future_value_series, future_value_at
+
+try:
+    from plotly_resampler import FigureResampler
+except ImportError:
+    # plotly-resampler is optional: without it long series are plotted at full resolution
+    FigureResampler = None
+
+# Line charts with more points than this are downsampled before being sent to the browser
+RESAMPLE_THRESHOLD = 2000
+
+
+# ---------------------------------------------------------------
+# Educational Content
+# ---------------------------------------------------------------
+FV_EXPLAIN = """
+**Future Value (FV)** shows how your money grows over time using **Compound Interest**.
+You earn interest not just on your principal but also on the interest accumulated.
+"""
+FV_FORMULA = r"FV = P(1 + \frac{r}{n})^{nt} + PMT \times \frac{(1 + \frac{r}{n})^{nt} - 1}{\frac{r}{n}}"
+FV_VARIABLES = """
+* **P**: Initial Principal  
+* **r**: Annual Interest Rate  
+* **n**: Compounding Frequency  
+* **t**: Time (Years)  
+* **PMT**: Periodic Contribution
+"""
+
+EMI_EXPLAIN = """
+**Amortization** shows how each loan payment is split between interest and principal.
+Early payments mostly cover interest, while later payments reduce the principal faster.
+"""
+EMI_FORMULA = r"EMI = \frac{P \times \frac{r}{n}}{1 - (1 + \frac{r}{n})^{-nt}}"
+EMI_TIP = "Tip: Understanding this helps plan mortgages and loans effectively."
 
 
 # ---------------------------------------------------------------
@@ -17,6 +50,50 @@ st.markdown(
 st.divider()
 
 
+# ---------------------------------------------------------------
+# Cached Calculations
+# ---------------------------------------------------------------
+@st.cache_data(max_entries=128)
+def _fv_series(P, r, t, n, PMT, monthly):
+    # Chart series for the FV mode: month-end balances, or year-end balances for frequency n
+    if monthly:
+        return future_value_series(P, r/12, t*12, PMT)
+    # Evaluate only the year-end periods n, 2n, ..., tn instead of every compounding period
+    return future_value_at(P, r/n, np.arange(1, t+1) * n, PMT)
+
+
+@st.cache_data(max_entries=128)
+def _emi(P, r, t, n):
+    return calculate_loan_emi(P, r, t, n)
+
+
+@st.cache_resource
+def _warm_up():
+    # Trigger the Numba compile of the FV series once per server instead of on the first chart
+    future_value_series(1.0, 0.05/12, 12, 1.0)
+    return True
+
+
+@st.cache_data(max_entries=128)
+def build_emi_pie(principal, interest):
+    # Principal vs interest breakdown for the loan mode
+    return go.Figure(data=[go.Pie(labels=['Principal', 'Interest'],
+                                  values=[principal, interest],
+                                  hole=.4,
+                                  marker_colors=['#2ecc71', '#e74c3c'])])
+
+
+def _add_line(fig, resample, x, y, **kwargs):
+    # FigureResampler takes the full-resolution data as hf_x/hf_y and downsamples it itself
+    if resample:
+        fig.add_trace(go.Scattergl(**kwargs), hf_x=x, hf_y=y)
+    else:
+        fig.add_trace(go.Scattergl(x=x, y=y, **kwargs))
+
+
+_warm_up()
+
+
 # ---------------------------------------------------------------
 # Sidebar: Inputs
 # ---------------------------------------------------------------
@@ -59,18 +136,9 @@ if mode == 'Future Value (Savings)':
 
     # Education Section
     with st.expander("Learn: How Savings Growth Works"):
-        st.write("""
-        **Future Value (FV)** shows how your money grows over time using **Compound Interest**.
-        You earn interest not just on your principal but also on the interest accumulated.
-        """)
-        st.latex(r"FV = P(1 + \frac{r}{n})^{nt} + PMT \times \frac{(1 + \frac{r}{n})^{nt} - 1}{\frac{r}{n}}")
-        st.write("""
-        * **P**: Initial Principal  
-        * **r**: Annual Interest Rate  
-        * **n**: Compounding Frequency  
-        * **t**: Time (Years)  
-        * **PMT**: Periodic Contribution
-        """)
+        st.write(FV_EXPLAIN)
+        st.latex(FV_FORMULA)
+        st.write(FV_VARIABLES)
 
     # Inputs
     col1, col2 = st.columns(2)
@@ -81,44 +149,55 @@ if mode == 'Future Value (Savings)':
         PMT = st.number_input("Periodic Contribution ($)", min_value=0.0, value=100.0, step=10.0,
                               help="Extra contribution added each period")
 
+    # Generate Yearly or Monthly Balances
+    balances, interest_earned = _fv_series(P, r, t, n, PMT, show_monthly)
+    if show_monthly:
+        x_axis = np.arange(1, t*12+1, dtype=np.int32)
+        x_label = "Months"
+    else:
+        x_axis = np.arange(1, t+1, dtype=np.int32)
+        x_label = "Years"
+    capitals = balances - interest_earned
+
     # Compute FV and Interest
-    fv, total_interest = calculate_future_value(P, r, t, n, PMT)
-    total_capital = P + (PMT * t * n)
+    if show_monthly and n != 12:
+        # The monthly chart compounds 12 times a year, so the headline at frequency n is computed separately
+        fv, total_interest = calculate_future_value(P, r, t, n, PMT)
+        total_capital = P + (PMT * t * n)
+    else:
+        # The last point of the chart is the final balance after t*n periods
+        fv = float(balances[-1])
+        total_capital = float(capitals[-1])
+        total_interest = fv - total_capital
 
     m1, m2, m3 = st.columns(3)
     m1.metric("Final Future Value", f"${fv:,.2f}")
     m2.metric("Total Interest Earned", f"${total_interest:,.2f}")
     m3.metric("Total Capital Invested", f"${total_capital:,.2f}")
 
-    # Generate Yearly or Monthly Balances
-    if show_monthly:
-        periods = t * 12
-        balances = [calculate_future_value(P, r, month/12, 12, PMT)[0] for month in range(1, periods+1)]
-        capitals = [P + PMT*month for month in range(1, periods+1)]
-        x_axis = list(range(1, periods+1))
-        x_label = "Months"
-    else:
-        balances = [calculate_future_value(P, r, year, n, PMT)[0] for year in range(1, t+1)]
-        capitals = [P + PMT*year*n for year in range(1, t+1)]
-        x_axis = list(range(1, t+1))
-        x_label = "Years"
-
-    # Plot FV vs Contributions
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=x_axis, y=balances, mode='lines+markers', name='Total Value',
-                             line=dict(color='#2ecc71', width=3),
-                             hovertemplate=f"{x_label}: %{{x}}<br>Total Value: $%{{y:,.2f}}<extra></extra>"))
-    fig.add_trace(go.Scatter(x=x_axis, y=capitals, mode='lines+markers', name='Principal Invested',
-                             line=dict(color='#3498db', dash='dash'),
-                             hovertemplate=f"{x_label}: %{{x}}<br>Capital: $%{{y:,.2f}}<extra></extra>"))
+    # Charts only need display precision, so float32 halves the data Plotly sends to the browser
+    balances, capitals, interest_earned = (np.asarray(a, dtype=np.float32)
+                                           for a in (balances, capitals, interest_earned))
+
+    # Plot FV vs Contributions (long series are downsampled with MinMaxLTTB when available)
+    resample = FigureResampler is not None and len(balances) > RESAMPLE_THRESHOLD
+    fig = FigureResampler(go.Figure()) if resample else go.Figure()
+    _add_line(fig, resample, x_axis, balances, mode='lines+markers', name='Total Value',
+              line=dict(color='#2ecc71', width=3),
+              hovertemplate=f"{x_label}: %{{x}}<br>Total Value: $%{{y:,.2f}}<extra></extra>")
+    _add_line(fig, resample, x_axis, capitals, mode='lines+markers', name='Principal Invested',
+              line=dict(color='#3498db', dash='dash'),
+              hovertemplate=f"{x_label}: %{{x}}<br>Capital: $%{{y:,.2f}}<extra></extra>")
     st.plotly_chart(fig, use_container_width=True)
 
     # Bar chart showing contributions vs interest earned
-    interest_earned = [balances[i] - capitals[i] for i in range(len(balances))]
     fig2 = go.Figure()
-    fig2.add_trace(go.Bar(x=x_axis, y=capitals, name='Contributions', marker_color='#3498db'))
-    fig2.add_trace(go.Bar(x=x_axis, y=interest_earned, name='Interest Earned', marker_color='#2ecc71'))
-    fig2.update_layout(barmode='stack', xaxis_title=x_label, yaxis_title='Amount ($)')
+    fig2.add_trace(go.Bar(x=x_axis, y=capitals, name='Contributions', marker_color='#3498db',
+                          hovertemplate=f"{x_label}: %{{x}}<br>Contributions: $%{{y:,.2f}}<extra></extra>"))
+    # Interest bars start at the contributions (base=), so Plotly does not need to stack them itself
+    fig2.add_trace(go.Bar(x=x_axis, y=interest_earned, base=capitals, name='Interest Earned', marker_color='#2ecc71',
+                          hovertemplate=f"{x_label}: %{{x}}<br>Interest Earned: $%{{y:,.2f}}<extra></extra>"))
+    fig2.update_layout(barmode='overlay', xaxis_title=x_label, yaxis_title='Amount ($)')
     st.plotly_chart(fig2, use_container_width=True)
 
 
@@ -130,19 +209,16 @@ elif mode == 'Loan Repayment (Debt)':
 
     # Education Section
     with st.expander("Learn: How is a Loan Payment Calculated?"):
-        st.write("""
-        **Amortization** shows how each loan payment is split between interest and principal.
-        Early payments mostly cover interest, while later payments reduce the principal faster.
-        """)
-        st.latex(r"EMI = \frac{P \times \frac{r}{n}}{1 - (1 + \frac{r}{n})^{-nt}}")
-        st.write("Tip: Understanding this helps plan mortgages and loans effectively.")
+        st.write(EMI_EXPLAIN)
+        st.latex(EMI_FORMULA)
+        st.write(EMI_TIP)
 
     # Input Loan Principal
     P_loan = st.number_input("Loan Principal ($)", min_value=1000.0, value=250000.0, step=10000.0,
                              help="The total amount you borrow")
 
     # EMI Calculation
-    emi = calculate_loan_emi(P_loan, r, t, n)
+    emi = _emi(P_loan, r, t, n)
     total_payments = emi * t * n
     total_interest_paid = total_payments - P_loan
 
@@ -152,9 +228,5 @@ elif mode == 'Loan Repayment (Debt)':
     c3.metric("Total Interest Paid", f"${total_interest_paid:,.2f}")
 
     # Pie chart for principal vs interest
-    fig = go.Figure(data=[go.Pie(labels=['Principal', 'Interest'],
-                                 values=[P_loan, total_interest_paid],
-                                 hole=.4,
-                                 marker_colors=['#2ecc71', '#e74c3c'])])
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_emi_pie(P_loan, total_interest_paid), use_container_width=True)
 
@@ -1,5 +1,43 @@
 import math
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the series falls back to the NumPy closed form
+    njit = None
+
+
+def _fv_core(P, i, N, PMT):
+    # FV math for an already-normalized periodic rate i and period count N
+    if i == 0:
+        # Case for 0% interest: FV is just principal + total contributions
+        fv = P + (PMT * N)
+        total_interest = 0
+        return fv, total_interest
+
+    # Growth (1 + i)^N - 1, computed once and shared by both terms below
+    # Taken as expm1(N * log1p(i)) to stay accurate for very small i (e.g. daily rates)
+    growth_m1 = math.expm1(N * math.log1p(i))
+
+    # Future Value of the Principal (without contributions)
+    fv_principal = P * (growth_m1 + 1)
+
+    # Future Value of an Ordinary Annuity (contributions at the end of each period)
+    fv_annuity = PMT * (growth_m1 / i)
+    
+    # Total Future Value = FV of principal + FV of contributions
+    fv = fv_principal + fv_annuity
+    
+    # Total capital invested = principal + sum of all contributions
+    total_capital = P + (PMT * N)
+
+    # Interest earned = FV - total capital invested
+    total_interest = fv - total_capital
+    
+    return fv, total_interest
+
 
 def calculate_future_value(P, r, t, n, PMT=0):
     """
@@ -24,28 +62,7 @@ def calculate_future_value(P, r, t, n, PMT=0):
     i = r / n       # Periodic rate
     N = t * n       # Total number of periods
 
-    if i == 0:
-        # Case for 0% interest: FV is just principal + total contributions
-        fv = P + (PMT * N)
-        total_interest = 0
-        return fv, total_interest
-
-    # Future Value of the Principal (without contributions)
-    fv_principal = P * (1 + i)**N
-    
-    # Future Value of an Ordinary Annuity (contributions at the end of each period)
-    fv_annuity = PMT * (((1 + i)**N - 1) / i)
-    
-    # Total Future Value = FV of principal + FV of contributions
-    fv = fv_principal + fv_annuity
-    
-    # Total capital invested = principal + sum of all contributions
-    total_capital = P + (PMT * N)
-
-    # Interest earned = FV - total capital invested
-    total_interest = fv - total_capital
-    
-    return fv, total_interest
+    return _fv_core(P, i, N, PMT)
 
 
 def calculate_loan_emi(P, r, t, n):
@@ -62,23 +79,114 @@ def calculate_loan_emi(P, r, t, n):
     emi: Regular payment amount per period
     """
 
-    # Convert interest rate from percentage to decimal if needed
-    if r > 1:
-        r = r / 100
+    return calculate_loan_emi_vec(P, r, t, n).item()
+
+
+def calculate_loan_emi_vec(P, r, t, n):
+    """
+    Calculates the Equal Monthly Installment (EMI) for a loan over arrays of rates and/or tenures.
+
+    Arguments:
+    P: Principal (Loan Amount)
+    r: Annual interest rate(s) (as a decimal), scalar or array
+    t: Time in years, scalar or array
+    n: Payment frequency per year (usually 12 for monthly)
+
+    Returns:
+    emi: Array of regular payment amounts per period
+    """
+
+    # Convert interest rates from percentage to decimal if needed
+    r = np.asarray(r, dtype=float)
+    r = np.where(r > 1, r / 100, r)
 
     i = r / n       # Periodic interest rate
-    N = t * n       # Total number of payments
+    N = np.asarray(t) * n       # Total number of payments
 
-    if i == 0:
-        # Case for 0% interest: simple division of principal over payments
-        return P / N 
-    
     # EMI formula: PMT = (P * i) / (1 - (1 + i)^-N)
-    denominator = 1 - (1 + i)**(-N)
-    
-    if denominator == 0:
-        return float('inf') 
-        
-    emi = (P * i) / denominator
+    # 1 - (1 + i)^-N computed as -expm1(-N * log1p(i)) to avoid cancellation for very small i
+    denominator = -np.expm1(-N * np.log1p(i))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        emi = np.where(denominator == 0, np.inf, (P * i) / denominator)
+
+        # Case for 0% interest: simple division of principal over payments
+        return np.where(i == 0, P / N, emi)
+
+
+def _fv_series_closed_form(P, i, N, PMT):
+    # FV after each of the periods 1..N, evaluated with the closed-form formula
+    k = np.arange(1, N + 1)
+    if i == 0:
+        return P + PMT * k
+    # Growth factors (1 + i)^k by running product instead of a pow per period
+    factor = np.cumprod(np.full(N, 1 + i))
+    return P * factor + PMT * (factor - 1) / i
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fv_series_kernel(P, i, N, PMT):
+        # Recurrence bal_k = bal_(k-1) * (1 + i) + PMT, one multiply-add per period
+        balances = np.empty(N)
+        bal = P
+        factor = 1 + i
+        for k in range(N):
+            bal = bal * factor + PMT
+            balances[k] = bal
+        return balances
+else:
+    _fv_series_kernel = _fv_series_closed_form
+
+
+def future_value_series(P, i, N, PMT=0):
+    """
+    Calculates the balance after every period of an investment with periodic contributions (PMT).
+
+    Arguments:
+    P: Principal (Initial Deposit)
+    i: Periodic interest rate (as a decimal)
+    N: Total number of periods
+    PMT: Periodic contribution amount
+
+    Returns:
+    balances: Array of the Future Value after periods 1..N
+    interest: Array of the interest earned after periods 1..N
+    """
+
+    balances = _fv_series_kernel(float(P), float(i), int(N), float(PMT))
+
+    # Capital invested after each period = principal + contributions so far
+    capitals = P + PMT * np.arange(1, N + 1)
+
+    return balances, balances - capitals
+
+
+def future_value_at(P, i, periods, PMT=0):
+    """
+    Calculates the Future Value of an investment at selected period counts in one vectorized step.
+
+    Arguments:
+    P: Principal (Initial Deposit)
+    i: Periodic interest rate (as a decimal)
+    periods: Array of period counts to evaluate (e.g. n, 2n, ... for year-end balances)
+    PMT: Periodic contribution amount
+
+    Returns:
+    balances: Array of the Future Value after each entry of periods
+    interest: Array of the interest earned after each entry of periods
+    """
+
+    k = np.asarray(periods)
+
+    # Capital invested after k periods = principal + contributions so far
+    capitals = P + PMT * k
+
+    if i == 0:
+        return capitals, np.zeros(k.shape)
+
+    # (1 + i)^k - 1 via expm1/log1p, matching calculate_future_value
+    growth_m1 = np.expm1(k * np.log1p(i))
+    balances = P * (growth_m1 + 1) + PMT * growth_m1 / i
 
-    return emi
+    return balances, balances - capitals